@@ -0,0 +1,219 @@
+"""
+Specialized binary-recursive chunker for a fixed chunk size and overlap
+"""
+
+import re
+from bisect import bisect_right
+from typing import List, Tuple, Union
+
+# Paragraph boundaries: a blank line, possibly containing whitespace
+_PARAGRAPH_RE = re.compile(r'\n\s*\n')
+# Sentence ends: terminal punctuation followed by whitespace
+_SENTENCE_END_RE = re.compile(r'[.?!](?=\s)')
+
+
+class FixedBinaryChunker:
+    """
+    Splits text by bisecting its paragraph range instead of searching separators recursively
+
+    Paragraphs are located once. Any range of paragraphs that does not fit is bisected at the
+    paragraph closest to its midpoint, so the recursion depth is bounded by
+    ceil(log2(len(text) / chunk_size)). Overlap is added in a second linear pass by extending
+    each chunk backwards into the previous one.
+
+    Calling an instance mirrors semchunk's Chunker, so it can be swapped in transparently.
+    """
+
+    def __init__(self, chunk_size: int, chunk_overlap: int):
+        """
+        Initialize FixedBinaryChunker
+
+        Args:
+            chunk_size (int): Maximum chunk length, overlap included
+            chunk_overlap (int): Characters shared with the previous chunk
+        """
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("chunk_overlap must be non-negative and smaller than chunk_size")
+
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        # Room left for new text once the overlap has been prepended
+        self.core_size = chunk_size - chunk_overlap
+
+    def _units(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Locate paragraphs, cutting any paragraph longer than core_size at line, sentence or word breaks
+
+        Args:
+            text (str): Text to split
+
+        Returns:
+            List[Tuple[int, int]]: Non-empty (start, end) spans in text order
+        """
+        units = []
+        position = 0
+
+        for boundary in _PARAGRAPH_RE.finditer(text):
+            units.extend(self._cut_paragraph(text, position, boundary.start()))
+            position = boundary.end()
+        units.extend(self._cut_paragraph(text, position, len(text)))
+
+        return units
+
+    @staticmethod
+    def _find_cut(text: str, start: int, limit: int) -> int:
+        """
+        Find where to end a piece that must stop by limit, preferring the coarsest boundary
+
+        Falls back from a line break to a sentence end to a space, like the recursive splitter's
+        separator list, and only cuts mid-word when the window has none of them. Extracted pages
+        separate paragraphs with single line breaks, so those are the usual cut.
+
+        Args:
+            text (str): Source text
+            start (int): Piece start offset
+            limit (int): Largest allowed piece end offset
+
+        Returns:
+            int: Piece end offset, greater than start
+        """
+        cut = text.rfind('\n', start + 1, limit + 1)
+        if cut > start:
+            return cut
+
+        sentence_end = None
+        for sentence_end in _SENTENCE_END_RE.finditer(text, start, limit):
+            pass
+        if sentence_end is not None:
+            return sentence_end.end()
+
+        cut = text.rfind(' ', start + 1, limit + 1)
+        return cut if cut > start else limit
+
+    def _cut_paragraph(self, text: str, start: int, end: int) -> List[Tuple[int, int]]:
+        """
+        Strip a paragraph and cut it into pieces no longer than core_size
+
+        Args:
+            text (str): Source text
+            start (int): Paragraph start offset
+            end (int): Paragraph end offset
+
+        Returns:
+            List[Tuple[int, int]]: Paragraph pieces
+        """
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+
+        pieces = []
+        while end - start > self.core_size:
+            cut = self._find_cut(text, start, start + self.core_size)
+            pieces.append((start, cut))
+
+            start = cut
+            while start < end and text[start].isspace():
+                start += 1
+
+        if start < end:
+            pieces.append((start, end))
+
+        return pieces
+
+    def _bisect(self, units: List[Tuple[int, int]], lo: int, hi: int, spans: List[Tuple[int, int]]) -> None:
+        """
+        Emit units[lo:hi] as one chunk if it fits, otherwise split the range in two
+
+        Args:
+            units (List[Tuple[int, int]]): Paragraph spans
+            lo (int): First unit index (inclusive)
+            hi (int): Last unit index (exclusive)
+            spans (List[Tuple[int, int]]): Output list of chunk spans
+        """
+        start, end = units[lo][0], units[hi - 1][1]
+        if end - start <= self.core_size or hi - lo == 1:
+            spans.append((start, end))
+            return
+
+        # Split at the unit boundary nearest the character midpoint, keeping both halves non-empty
+        starts = [unit[0] for unit in units[lo:hi]]
+        mid = lo + bisect_right(starts, (start + end) // 2)
+        mid = min(max(mid, lo + 1), hi - 1)
+
+        self._bisect(units, lo, mid, spans)
+        self._bisect(units, mid, hi, spans)
+
+    def _add_overlap(self, text: str, spans: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Extend each chunk backwards by up to chunk_overlap characters, snapping to a word start
+
+        Args:
+            text (str): Source text
+            spans (List[Tuple[int, int]]): Non-overlapping chunk spans
+
+        Returns:
+            List[Tuple[int, int]]: Overlapping chunk spans
+        """
+        if not self.chunk_overlap:
+            return spans
+
+        overlapped = spans[:1]
+        for (previous_start, _), (start, end) in zip(spans, spans[1:]):
+            new_start = max(start - self.chunk_overlap, previous_start)
+            space = text.find(' ', new_start, start)
+            if new_start > previous_start and space != -1:
+                new_start = space + 1
+            overlapped.append((new_start, end))
+
+        return overlapped
+
+    def split(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Split text into chunk spans
+
+        Args:
+            text (str): Text to split
+
+        Returns:
+            List[Tuple[int, int]]: (start, end) offsets of each chunk
+        """
+        units = self._units(text)
+        if not units:
+            return []
+
+        spans = []
+        self._bisect(units, 0, len(units), spans)
+        return self._add_overlap(text, spans)
+
+    def __call__(
+        self,
+        text_or_texts: Union[str, List[str]],
+        processes: int = 1,
+        offsets: bool = False,
+        overlap: int = None
+    ):
+        """
+        Chunk one text or a list of texts, matching semchunk's Chunker call signature
+
+        Args:
+            text_or_texts (Union[str, List[str]]): Text(s) to chunk
+            processes (int): Accepted for compatibility; splitting is already linear
+            offsets (bool): Also return the (start, end) offsets of each chunk
+            overlap (int): Accepted for compatibility; the overlap is fixed at construction
+
+        Returns:
+            Chunks, or (chunks, offsets) when offsets is True; lists of those for a list input
+        """
+        texts = [text_or_texts] if isinstance(text_or_texts, str) else text_or_texts
+
+        all_chunks, all_offsets = [], []
+        for text in texts:
+            spans = self.split(text)
+            all_chunks.append([text[start:end] for start, end in spans])
+            all_offsets.append(spans)
+
+        if isinstance(text_or_texts, str):
+            all_chunks, all_offsets = all_chunks[0], all_offsets[0]
+
+        return (all_chunks, all_offsets) if offsets else all_chunks
@@ -0,0 +1,123 @@
+"""
+Persistent cache of chunk offsets, so unchanged pages are never re-split
+"""
+
+import dbm
+import os
+import threading
+import msgspec
+from blake3 import blake3
+from typing import List, Optional, Tuple
+from langchain.schema import Document
+
+from config import config
+
+# Bump whenever the chunking algorithm changes so stale entries are never served
+_KEY_VERSION = 4
+
+# Spans are stored as MessagePack; encoder/decoder are reused across calls
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder(List[Tuple[int, int]])
+
+# Pages at least this large are hashed with BLAKE3's multithreaded tree mode
+_PARALLEL_HASH_BYTES = 1 << 20
+
+class ChunkCache:
+    """Disk-backed (dbm + MessagePack) cache mapping (source, content, chunk settings) to chunk offsets"""
+
+    def __init__(self, directory: str = None):
+        """
+        Initialize ChunkCache
+
+        Args:
+            directory (str): Directory holding the cache files
+        """
+        self.directory = directory or config.cache.directory
+        self._lock = threading.Lock()
+        self._db = None
+
+    def _open(self):
+        """
+        Open the underlying dbm file on first use
+
+        Returns:
+            Open dbm database
+        """
+        if self._db is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._db = dbm.open(os.path.join(self.directory, "spans"), "c")
+        return self._db
+
+    @staticmethod
+    def make_key(document: Document, chunk_size: int, chunk_overlap: int, algorithm: str = "") -> str:
+        """
+        Build a cache key from the document's source, content and chunk settings
+
+        Args:
+            document (Document): Document to be chunked
+            chunk_size (int): Size of text chunks
+            chunk_overlap (int): Overlap between chunks
+            algorithm (str): Name of the chunker producing the spans
+
+        Returns:
+            str: Hex digest identifying the chunking result
+        """
+        content = document.page_content.encode()
+        max_threads = blake3.AUTO if len(content) >= _PARALLEL_HASH_BYTES else 1
+
+        digest = blake3(max_threads=max_threads)
+        digest.update(f"v{_KEY_VERSION}\0".encode())
+        digest.update(repr(sorted(document.metadata.items())).encode())
+        digest.update(b"\0")
+        digest.update(content)
+        digest.update(f"\0{chunk_size}\0{chunk_overlap}\0{algorithm}".encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[Tuple[int, int]]]:
+        """
+        Look up cached chunk spans
+
+        Args:
+            key (str): Cache key from make_key
+
+        Returns:
+            Optional[List[Tuple[int, int]]]: Cached (start, end) spans or None on a miss
+        """
+        try:
+            with self._lock:
+                raw = self._open().get(key)
+            return _decoder.decode(raw) if raw is not None else None
+        except Exception:
+            return None
+
+    def set(self, key: str, spans: List[Tuple[int, int]]) -> bool:
+        """
+        Store chunk spans in the cache
+
+        Args:
+            key (str): Cache key from make_key
+            spans (List[Tuple[int, int]]): (start, end) offsets of each chunk
+
+        Returns:
+            bool: True if stored, False otherwise
+        """
+        try:
+            raw = _encoder.encode(spans)
+            with self._lock:
+                db = self._open()
+                db[key] = raw
+                if hasattr(db, "sync"):
+                    db.sync()
+            return True
+        except Exception:
+            return False
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        with self._lock:
+            db = self._open()
+            for key in list(db.keys()):
+                del db[key]
+
+
+chunk_cache = ChunkCache()
@@ -6,31 +6,89 @@ import os
 from dataclasses import dataclass
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChunkingConfig:
     """Configuration for the text chunking parameter"""
     chunk_size: int = 1000
     chunk_overlap: int = 200
+    # Use the specialized FixedBinaryChunker when running with the default size/overlap
+    use_binary_chunker: bool = True
+    # len() is already C-level; memoizing it costs more than calling it.
+    # Only enable memoization when length_function is an expensive token counter.
+    memoize_lengths: bool = False
     length_function = len
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class LoaderConfig:
+    """Configuration for fetching web content"""
+    max_concurrency: int = 5
+    request_timeout: int = 30
+    pool_size: int = 20
+    max_retries: int = 2
+    backoff_factor: float = 0.2
+    extract_main_content: bool = True
+    user_agent: str = "Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/118.0"
+
+@dataclass(slots=True, frozen=True)
 class EmbeddingConfig:
     """Configuration for embedding model"""
     model_name: str = "models/embedding-001"
+    batch_size: int = 64
+    # Embedding requests in flight at once, to stay within the API's rate limits
+    max_concurrency: int = 4
+    # Query strings whose embeddings are kept, so repeated queries skip the embedding request
+    query_cache_size: int = 256
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMConfig:
     """Configuration for Language Model"""
     model_name: str = "gemini-2.0-flash"
     temperature: float = 0.7
+    streaming: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class RetrievalConfig:
-    """Configuration for retrieval setting"""
+    """Configuration for retrieval setting (mutable: search_k follows the sidebar slider)"""
     search_k: int = 3
     chain_type: str = "stuff"
+    # "IVF" sizes an IVF index from the corpus (nlist below) with vectors encoded by `quantizer`;
+    # any other value is a faiss.index_factory spec such as "HNSW32,SQ8", "HNSW32" or "Flat"
+    index_type: str = os.environ.get("RAG_INDEX_TYPE", "IVF")
+    # Vector encoding for "IVF": "none" (float32), "sq8" (int8 per dimension, 4x smaller) or
+    # "pq" (M x nbits product codes). Corpora too small to train IVF get an exact, unquantized "Flat" index.
+    quantizer: str = os.environ.get("RAG_QUANTIZER", "sq8")
+    ivf_nlist: Optional[int] = None  # None: max(64, sqrt(N))
+    nprobe: int = 8  # IVF lists scanned per query: the main IVF speed/recall knob
+    pq_m: Optional[int] = None  # None: dim // 8, lowered until it divides dim
+    pq_nbits: int = 8
+    # Learn an OPQ rotation with the PQ codebooks and assign IVF lists via an HNSW coarse quantizer
+    pq_opq: bool = True
+    ef_search: int = 64  # HNSW candidate list size per query
+    # Move the index to CUDA device(s) when faiss has GPU support and a device is present;
+    # HNSW-based indexes, which faiss cannot run on GPU, stay on CPU
+    use_gpu: bool = True
+    # Keep chunk texts in a memory-mapped JSONL file under cache.directory instead of Python objects
+    mmap_docstore: bool = True
+    # Unit-normalize embeddings and search by inner product (cosine) instead of L2 distance
+    use_inner_product: bool = True
+    # Answer via a direct retrieve -> prompt -> LLM path; False routes through RetrievalQAWithSourcesChain
+    bypass_chain: bool = True
+
+@dataclass(slots=True, frozen=True)
+class CacheConfig:
+    """Configuration for the persistent chunk cache and the semantic response cache"""
+    enabled: bool = True
+    directory: str = os.path.join(os.path.expanduser("~"), ".cache", "research_tool")
+    response_cache_enabled: bool = True
+    response_similarity_threshold: float = 0.92
+    response_cache_size: int = 256
+    # SIM-LRU cache of similarity_search neighbours, keyed by query embedding
+    search_cache_enabled: bool = True
+    search_cache_size: int = 128
+    search_cache_k_prime: int = 10  # neighbours stored per entry; serves any k up to this
+    search_cache_threshold: float = 0.1  # max L2 distance between unit query vectors (cos >= 0.995)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StreamlitConfig:
     """Configuration for Streamlit UI"""
     page_title: str = "Research Tool"
@@ -42,9 +100,11 @@ class Config:
 
     def __init__(self):
         self.chunking = ChunkingConfig()
+        self.loader = LoaderConfig()
         self.embedding = EmbeddingConfig()
         self.llm = LLMConfig()
         self.retrieval = RetrievalConfig()
+        self.cache = CacheConfig()
         self.streamlit = StreamlitConfig()
 
     def set_api_key(self, api_key: str) -> None:
@@ -2,15 +2,156 @@
 Document processing module for loading and chunking web content
 """
 
+import asyncio
+import aiohttp
+import numpy as np
 import streamlit as st
-from langchain_community.document_loaders import WebBaseLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from typing import List, Optional
+import semchunk
+import trafilatura
+import lxml.html
+from lxml import etree
+from typing import AsyncIterator, Callable, List, Optional, Tuple
 from langchain.schema import Document
 
+from binary_chunker import FixedBinaryChunker
+from chunk_cache import ChunkCache, chunk_cache
 from config import config
 from utils import show_error_message, show_success_message, display_processing_stats
 
+
+# Elements that never carry article text
+_BOILERPLATE_TAGS = ["script", "style", "noscript", "nav", "header", "footer", "aside", "form"]
+
+def _extract_text(tree: etree._Element) -> str:
+    """
+    Extract the main text of a page, dropping navigation and other boilerplate
+    
+    Args:
+        tree (etree._Element): Parsed page; trafilatura works on its own copy, the fallback strips it in place
+        
+    Returns:
+        str: Cleaned page text
+    """
+    if config.loader.extract_main_content:
+        text = trafilatura.extract(tree, include_comments=False)
+        if text:
+            return text
+    
+    etree.strip_elements(tree, etree.Comment, *_BOILERPLATE_TAGS, with_tail=False)
+    
+    return " ".join(piece.strip() for piece in tree.itertext() if piece.strip())
+
+def _parse_document(url: str, html: str) -> Document:
+    """
+    Parse a fetched page once and build its Document from the single tree
+    
+    Args:
+        url (str): Page URL
+        html (str): Raw page HTML
+        
+    Returns:
+        Document: Page text with source metadata
+    """
+    tree = trafilatura.load_html(html)
+    if tree is None:
+        # trafilatura rejects fragments without an <html> root; lxml wraps them in one
+        tree = lxml.html.document_fromstring(html)
+    
+    metadata = {"source": url}
+    
+    title = tree.findtext(".//title")
+    if title:
+        metadata["title"] = title
+    
+    description = tree.find(".//meta[@name='description']")
+    if description is not None:
+        metadata["description"] = description.get("content", "No description found.")
+    
+    if tree.tag == "html":
+        metadata["language"] = tree.get("lang", "No language found.")
+    
+    return Document(page_content=_extract_text(tree), metadata=metadata)
+
+async def _fetch_document(session: aiohttp.ClientSession, url: str, semaphore: asyncio.Semaphore) -> Document:
+    """
+    Fetch a single URL and parse it into a Document, retrying connection failures with backoff
+    
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        url (str): URL to fetch
+        semaphore (asyncio.Semaphore): Limits the number of requests in flight
+        
+    Returns:
+        Document: Page text with source metadata
+    """
+    async with semaphore:
+        for attempt in range(config.loader.max_retries + 1):
+            try:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    html = await response.text()
+                break
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == config.loader.max_retries:
+                    raise
+                await asyncio.sleep(config.loader.backoff_factor * (2 ** attempt))
+    
+    # Parsing and extraction are CPU-bound; off the event loop they don't stall other downloads
+    return await asyncio.to_thread(_parse_document, url, html)
+
+async def _iter_documents(
+    urls: List[str],
+    max_concurrency: int,
+    on_complete: Optional[Callable[[int], None]] = None
+) -> AsyncIterator[Document]:
+    """
+    Fetch URLs concurrently and yield each Document as soon as it arrives
+    
+    Args:
+        urls (List[str]): URLs to fetch
+        max_concurrency (int): Maximum number of simultaneous requests
+        on_complete (Callable[[int], None]): Called with the number of finished URLs, failed or not
+        
+    Yields:
+        Document: Documents in completion order; failed URLs are reported and skipped
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    timeout = aiohttp.ClientTimeout(total=config.loader.request_timeout)
+    headers = {"User-Agent": config.loader.user_agent}
+    
+    async def fetch(session: aiohttp.ClientSession, url: str):
+        try:
+            return url, await _fetch_document(session, url, semaphore)
+        except Exception as e:
+            return url, e
+    
+    # One pooled, keep-alive connector for the whole batch so same-host URLs reuse connections
+    connector = aiohttp.TCPConnector(limit=config.loader.pool_size, ttl_dns_cache=300)
+    
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+        for completed, next_result in enumerate(asyncio.as_completed([fetch(session, url) for url in urls]), 1):
+            url, result = await next_result
+            if on_complete:
+                on_complete(completed)
+            
+            if isinstance(result, Exception):
+                show_error_message(result, f"Loading {url}")
+            else:
+                yield result
+
+async def _fetch_documents(urls: List[str], max_concurrency: int) -> List[Document]:
+    """
+    Fetch all URLs concurrently, bounded by max_concurrency
+    
+    Args:
+        urls (List[str]): URLs to fetch
+        max_concurrency (int): Maximum number of simultaneous requests
+        
+    Returns:
+        List[Document]: Documents for every URL that loaded successfully
+    """
+    return [document async for document in _iter_documents(urls, max_concurrency)]
+
 class DocumentProcessor:
     """Handles document loading and text chunking operations"""
     
@@ -25,11 +166,30 @@ class DocumentProcessor:
         self.chunk_size = chunk_size or config.chunking.chunk_size
         self.chunk_overlap = chunk_overlap or config.chunking.chunk_overlap
         
-        # Initialize text splitter
-        self.text_splitter = RecursiveCharacterTextSplitter(
+        # Initialize chunker
+        self.chunker = self._build_chunker()
+    
+    def _build_chunker(self):
+        """
+        Build the chunker for the current settings
+        
+        The default settings get a specialized binary-recursive chunker; anything else
+        goes through the general-purpose semchunk chunker.
+        
+        Returns:
+            Chunker callable with semchunk's call signature
+        """
+        is_default = (
+            self.chunk_size == config.chunking.chunk_size
+            and self.chunk_overlap == config.chunking.chunk_overlap
+        )
+        if config.chunking.use_binary_chunker and is_default:
+            return FixedBinaryChunker(self.chunk_size, self.chunk_overlap)
+        
+        return semchunk.chunkerify(
+            config.chunking.length_function,
             chunk_size=self.chunk_size,
-            chunk_overlap=self.chunk_overlap,
-            length_function=config.chunking.length_function
+            memoize=config.chunking.memoize_lengths
         )
     
     def load_documents_from_urls(self, urls: List[str]) -> Optional[List[Document]]:
@@ -48,8 +208,7 @@ class DocumentProcessor:
                 return None
             
             with st.spinner(f"Loading content from {len(urls)} URLs..."):
-                loader = WebBaseLoader(urls)
-                documents = loader.load()
+                documents = asyncio.run(_fetch_documents(urls, config.loader.max_concurrency))
             
             if not documents:
                 show_error_message(ValueError("No content loaded from URLs"), "Document Loading")
@@ -66,6 +225,63 @@ class DocumentProcessor:
             show_error_message(e, "Document Loading")
             return None
     
+    def _chunk_spans(self, documents: List[Document]) -> List[List[Tuple[int, int]]]:
+        """
+        Run the chunker over each document's text and return the chunk offsets
+        
+        Args:
+            documents (List[Document]): Documents to split
+            
+        Returns:
+            List[List[Tuple[int, int]]]: (start, end) spans for each input document, in input order
+        """
+        texts = [document.page_content for document in documents]
+        _, offsets_per_document = self.chunker(
+            texts,
+            offsets=True,
+            overlap=self.chunk_overlap
+        )
+        
+        return [[tuple(span) for span in offsets] for offsets in offsets_per_document]
+    
+    def split_into_chunks(self, documents: List[Document]) -> List[Document]:
+        """
+        Split documents into chunks, reusing cached spans for unchanged content
+        
+        Each chunk records its (start, end) span in the source text in its metadata.
+        
+        Args:
+            documents (List[Document]): Documents to split
+            
+        Returns:
+            List[Document]: Chunks, in input order
+        """
+        if config.cache.enabled:
+            algorithm = type(self.chunker).__name__
+            keys = [
+                ChunkCache.make_key(document, self.chunk_size, self.chunk_overlap, algorithm)
+                for document in documents
+            ]
+            spans = [chunk_cache.get(key) for key in keys]
+            
+            misses = [i for i, document_spans in enumerate(spans) if document_spans is None]
+            if misses:
+                fresh = self._chunk_spans([documents[i] for i in misses])
+                for i, document_spans in zip(misses, fresh):
+                    spans[i] = document_spans
+                    chunk_cache.set(keys[i], document_spans)
+        else:
+            spans = self._chunk_spans(documents)
+        
+        return [
+            Document(
+                page_content=document.page_content[start:end],
+                metadata={**document.metadata, "start": start, "end": end}
+            )
+            for document, document_spans in zip(documents, spans)
+            for start, end in document_spans
+        ]
+    
     def chunk_documents(self, documents: List[Document]) -> Optional[List[Document]]:
         """
         Split documents into smaller chunks
@@ -82,15 +298,16 @@ class DocumentProcessor:
                 return None
             
             with st.spinner("Splitting documents into chunks..."):
-                chunks = self.text_splitter.split_documents(documents)
+                chunks = self.split_into_chunks(documents)
             
             if not chunks:
                 show_error_message(ValueError("No chunks created"), "Document Chunking")
                 return None
             
+            total_chars = sum(len(chunk.page_content) for chunk in chunks)
             show_success_message(
                 f"Successfully created {len(chunks)} text chunks",
-                f"Average chunk size: ~{sum(len(chunk.page_content) for chunk in chunks) // len(chunks)} characters"
+                f"Average chunk size: ~{total_chars // len(chunks)} characters"
             )
             
             return chunks
@@ -99,9 +316,36 @@ class DocumentProcessor:
             show_error_message(e, "Document Chunking")
             return None
     
+    async def _stream_chunks(self, urls: List[str]) -> Tuple[List[Document], int, int]:
+        """
+        Split each document as soon as it is fetched, overlapping chunking with network I/O
+        
+        Args:
+            urls (List[str]): List of URLs to process
+            
+        Returns:
+            Tuple[List[Document], int, int]: (chunks, num_documents, total_chunk_characters)
+        """
+        chunks = []
+        num_documents = 0
+        total_chars = 0
+        progress_bar = st.progress(0.0, text=f"Loading content from {len(urls)} URLs...")
+        
+        def update_progress(completed: int) -> None:
+            progress_bar.progress(completed / len(urls), text=f"Loaded {completed} of {len(urls)} URLs")
+        
+        async for document in _iter_documents(urls, config.loader.max_concurrency, update_progress):
+            document_chunks = await asyncio.to_thread(self.split_into_chunks, [document])
+            chunks.extend(document_chunks)
+            num_documents += 1
+            total_chars += sum(len(chunk.page_content) for chunk in document_chunks)
+        
+        progress_bar.empty()
+        return chunks, num_documents, total_chars
+    
     def process_urls(self, urls: List[str]) -> Optional[List[Document]]:
         """
-        Complete pipeline: load URLs and chunk documents
+        Complete pipeline: stream documents from URLs and chunk them as they arrive
         
         Args:
             urls (List[str]): List of URLs to process
@@ -110,20 +354,29 @@ class DocumentProcessor:
             Optional[List[Document]]: Processed document chunks or None if failed
         """
         try:
-            # Load documents
-            documents = self.load_documents_from_urls(urls)
-            if not documents:
+            if not urls:
+                show_error_message(ValueError("No URLs provided"), "Document Loading")
+                return None
+            
+            chunks, num_documents, total_chars = asyncio.run(self._stream_chunks(urls))
+            
+            if not num_documents:
+                show_error_message(ValueError("No content loaded from URLs"), "Document Loading")
                 return None
             
-            # Chunk documents
-            chunks = self.chunk_documents(documents)
             if not chunks:
+                show_error_message(ValueError("No chunks created"), "Document Chunking")
                 return None
             
+            show_success_message(
+                f"Successfully created {len(chunks)} text chunks from {num_documents} documents",
+                f"Average chunk size: ~{total_chars // len(chunks)} characters"
+            )
+            
             # Display processing statistics
             display_processing_stats(
                 num_chunks=len(chunks),
-                num_documents=len(documents),
+                num_documents=num_documents,
                 num_urls=len(urls)
             )
             
@@ -146,17 +399,22 @@ class DocumentProcessor:
         if not documents:
             return {}
         
-        total_chars = sum(len(doc.page_content) for doc in documents)
-        sources = set()
-        
-        for doc in documents:
-            if hasattr(doc, 'metadata') and 'source' in doc.metadata:
-                sources.add(doc.metadata['source'])
+        lengths = np.fromiter(
+            (len(doc.page_content) for doc in documents),
+            dtype=np.int64,
+            count=len(documents)
+        )
+        sources = frozenset(
+            doc.metadata['source'] for doc in documents
+            if hasattr(doc, 'metadata') and 'source' in doc.metadata
+        )
         
         return {
             'total_documents': len(documents),
-            'total_characters': total_chars,
-            'average_length': total_chars // len(documents) if documents else 0,
+            'total_characters': int(lengths.sum()),
+            'average_length': int(lengths.mean()),
+            'max_length': int(lengths.max()),
+            'p95_length': int(np.percentile(lengths, 95)),
             'unique_sources': len(sources),
             'sources': list(sources)
         }
@@ -169,15 +427,15 @@ class DocumentProcessor:
             chunk_size (int): New chunk size
             chunk_overlap (int): New chunk overlap
         """
+        # Called on every rerun; only rebuild the chunker when the settings actually change
+        if (chunk_size, chunk_overlap) == (self.chunk_size, self.chunk_overlap):
+            return
+        
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         
-        # Reinitialize text splitter with new settings
-        self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=self.chunk_size,
-            chunk_overlap=self.chunk_overlap,
-            length_function=config.chunking.length_function
-        )
+        # Reinitialize chunker with new settings
+        self.chunker = self._build_chunker()
         
         st.info(f"Updated chunk settings - Size: {chunk_size}, Overlap: {chunk_overlap}")
 
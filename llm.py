@@ -0,0 +1,38 @@
+"""
+Gemini LLM wrapper that streams tokens to LangChain callbacks
+"""
+
+from langchain_core.messages import HumanMessage
+from langchain_google_genai import GoogleGenerativeAI
+from langchain.schema import Generation, LLMResult
+from langchain.schema.output import GenerationChunk
+
+class StreamingGoogleGenerativeAI(GoogleGenerativeAI):
+    """GoogleGenerativeAI that generates through _stream so callbacks receive tokens as they arrive"""
+    
+    streaming: bool = True
+    
+    def _stream(self, prompt, stop=None, run_manager=None, **kwargs):
+        """Stream chunks from the chat client, reporting each one to the callbacks exactly once"""
+        # The chat client fires on_llm_new_token itself when handed a run manager, and the parent
+        # class fires it again for the same chunk, so only this layer reports tokens
+        for stream_chunk in self.client._stream([HumanMessage(content=prompt)], stop=stop, **kwargs):
+            chunk = GenerationChunk(text=stream_chunk.message.content, generation_info=stream_chunk.generation_info)
+            yield chunk
+            if run_manager:
+                run_manager.on_llm_new_token(chunk.text, chunk=chunk, verbose=self.verbose)
+    
+    def _generate(self, prompts, stop=None, run_manager=None, **kwargs) -> LLMResult:
+        """Generate by merging streamed chunks, firing on_llm_new_token for each one"""
+        if not self.streaming:
+            return super()._generate(prompts, stop=stop, run_manager=run_manager, **kwargs)
+        
+        generations = []
+        for prompt in prompts:
+            # GenerationChunk.__add__ joins the text and merges generation_info, e.g. the final finish_reason
+            generation = GenerationChunk(text="")
+            for chunk in self._stream(prompt, stop=stop, run_manager=run_manager, **kwargs):
+                generation += chunk
+            generations.append([Generation(text=generation.text, generation_info=generation.generation_info)])
+        
+        return LLMResult(generations=generations)
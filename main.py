@@ -2,8 +2,7 @@ import streamlit as st
 from typing import List
 from utils import (
     setup_gemini_api,
-    parse_urls_from_input,
-    validate_urls,
+    parse_and_validate,
     show_error_message,
     show_success_message
 )
@@ -14,29 +13,41 @@ from qa_chain import create_qa_chain_manager
 from ui_components import UIComponents
 from config import config
 
+# Static help text, built once at import rather than on every rerun
+CAPABILITIES_MARKDOWN = """
+- 📊 Analyze content from multiple resources
+- 🔍 Compare information across different websites
+- 💡 Extract specific information with intelligent search
+- 📝 Get sourced answers with proper attribution
+- ❓ Ask complex questions spanning multiple documents
+"""
+
 class ResearchToolApp:
     """Main Class for the research tool"""
 
+    SESSION_DEFAULTS = {
+        'vector_store': None,
+        'qa_chain': None,
+        'processed_urls': [],
+        'document_processor': None,
+        'vector_store_manager': None,
+        'qa_chain_manager': None,
+        'api_key_configured': False,
+        'current_api_key': None
+    }
+
     def __init__(self):
         self.initialize_session_state()
         UIComponents.setup_page_config()
 
     def initialize_session_state(self):
-        """Initializing Streamlit session"""
-        session_default = {
-            'vector_store': None,
-            'qa_chain': None,
-            'processed_urls': [],
-            'document_processor': None,
-            'vector_store_manager': None,
-            'qa_chain_manager': None,
-            'api_key_configured': False,
-            'current_api_key': None
-        }
-
-        for key, default_value in session_default.items():
-            if key not in st.session_state:
-                st.session_state[key] = default_value
+        """Initializing Streamlit session once, guarded by a single sentinel key"""
+        if not st.session_state.get('_rt_initialized'):
+            st.session_state.update({
+                key: list(value) if isinstance(value, list) else value
+                for key, value in self.SESSION_DEFAULTS.items()
+            })
+            st.session_state._rt_initialized = True
 
     def setup_managers(self, api_key: str, chunk_size: int, chunk_overlap: int):
         """Setup all managers with proper error handling and state management"""
@@ -152,6 +163,23 @@ class ResearchToolApp:
         except Exception as e:
             show_error_message(e, "Query Processing")
 
+    @st.fragment
+    def render_query_column(self):
+        """Render the query column as a fragment so asking questions reruns only this block"""
+        st.subheader("❓ Ask Questions")
+        if st.session_state.qa_chain and st.session_state.processed_urls:
+            query, ask_button = UIComponents.render_query_section()
+
+            if ask_button and query.strip():
+                self.handle_query(query.strip())
+            elif ask_button:
+                st.error("Please enter a question")
+        else:
+            st.info("Please process URLs first to enable querying")
+
+            st.markdown("**What you can do after processing URLs:**")
+            st.markdown(CAPABILITIES_MARKDOWN)
+
     def run(self):
         """Main application runner"""
         UIComponents.render_header()
@@ -186,17 +214,15 @@ class ResearchToolApp:
 
             if process_button:
                 if urls_input.strip():
-                    urls = parse_urls_from_input(urls_input)
-                    valid_urls, invalid_urls = validate_urls(urls)
+                    valid_urls, invalid_urls = parse_and_validate(urls_input)
 
                     if invalid_urls:
                         st.error(f"Invalid URLs found: {', '.join(invalid_urls)}")
 
                     if valid_urls:
                         st.info(f"Processing {len(valid_urls)} valid URLs...")
-                        success = self.process_urls(valid_urls)
-                        if success:
-                            st.rerun()  # Refresh to show updated state
+                        # The query column renders after this one, so it picks up the new state without a rerun
+                        self.process_urls(valid_urls)
                     else:
                         st.error("No valid URLs to process")
                 else:
@@ -205,25 +231,7 @@ class ResearchToolApp:
             UIComponents.render_processing_status(st.session_state.processed_urls)
         
         with col2:
-            st.subheader("❓ Ask Questions")
-            if st.session_state.qa_chain and st.session_state.processed_urls:
-                query, ask_button = UIComponents.render_query_section()
-
-                if ask_button and query.strip():
-                    self.handle_query(query.strip())
-                elif ask_button:
-                    st.error("Please enter a question")
-            else:
-                st.info("Please process URLs first to enable querying")
-
-                st.markdown("**What you can do after processing URLs:**")
-                st.markdown("""
-                - 📊 Analyze content from multiple resources
-                - 🔍 Compare information across different websites
-                - 💡 Extract specific information with intelligent search
-                - 📝 Get sourced answers with proper attribution
-                - ❓ Ask complex questions spanning multiple documents
-                """)
+            self.render_query_column()
 
         UIComponents.render_system_status()
         UIComponents.render_footer()
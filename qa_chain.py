@@ -2,16 +2,159 @@
 Question answering chain module using RetrievalQAWithSourcesChain
 """
 
+import hashlib
+import logging
+import re
+import faiss
+import numpy as np
 import streamlit as st
-from langchain_google_genai import GoogleGenerativeAI
-from langchain.chains import RetrievalQAWithSourcesChain
+from langchain.callbacks.base import BaseCallbackHandler
 from langchain.prompts import PromptTemplate
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from config import config
 from utils import show_error_message, show_success_message, format_sources
 from vector_store import VectorStoreManager
 
+# Same split the chain applies when separating the answer from its sources
+_SOURCES_RE = re.compile(r"SOURCES?:", re.IGNORECASE)
+_ANSWER_SPLIT_RE = re.compile(r"SOURCES?:|QUESTION:\s", re.IGNORECASE)
+
+logger = logging.getLogger(__name__)
+
+def _split_sources(text: str) -> Tuple[str, str]:
+    """
+    Split the cited sources off an LLM answer exactly as RetrievalQAWithSourcesChain does
+    
+    Args:
+        text (str): Raw LLM output
+        
+    Returns:
+        Tuple[str, str]: (answer, sources)
+    """
+    if not _SOURCES_RE.search(text):
+        return text, ""
+    answer, sources = _ANSWER_SPLIT_RE.split(text)[:2]
+    return answer, sources.split("\n", 1)[0].strip()
+
+class StreamlitTokenHandler(BaseCallbackHandler):
+    """Renders the answer into a Streamlit placeholder token by token"""
+    
+    def __init__(self, placeholder):
+        """
+        Initialize StreamlitTokenHandler
+        
+        Args:
+            placeholder: Streamlit st.empty() container to write into
+        """
+        self.placeholder = placeholder
+        self.text = ""
+    
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        """Append a token and re-render the answer so far, hiding the trailing SOURCES block"""
+        self.text += token
+        answer = _SOURCES_RE.split(self.text, maxsplit=1)[0]
+        self.placeholder.markdown(answer + "▌")
+
+@st.cache_resource(show_spinner=False)
+def _build_llm(api_key: str, model_name: str, temperature: float, streaming: bool) -> "StreamingGoogleGenerativeAI":
+    """
+    Build the LLM once per (api_key, model, temperature, streaming) for the whole process
+    
+    Args:
+        api_key (str): Google API key
+        model_name (str): Gemini model name
+        temperature (float): Sampling temperature
+        streaming (bool): Whether tokens are streamed to callbacks
+        
+    Returns:
+        StreamingGoogleGenerativeAI: Shared LLM instance
+    """
+    # Deferred so the Google client stack is only imported once an LLM is actually needed
+    from llm import StreamingGoogleGenerativeAI
+    
+    return StreamingGoogleGenerativeAI(
+        model=model_name,
+        google_api_key=api_key,
+        temperature=temperature,
+        streaming=streaming
+    )
+
+class SourceAccumulator(BaseCallbackHandler):
+    """Formats the retrieved sources while the LLM is still generating"""
+    
+    def __init__(self):
+        """Initialize SourceAccumulator"""
+        self.num_source_docs = None
+        self.sources = None
+        self.formatted_sources = None
+    
+    def on_retriever_end(self, documents, **kwargs: Any) -> None:
+        """Count the retrieved documents and pre-format their unique sources"""
+        self.num_source_docs = len(documents)
+        unique_sources = dict.fromkeys(doc.metadata.get('source', '') for doc in documents)
+        self.sources = ", ".join(source for source in unique_sources if source)
+        self.formatted_sources = format_sources(self.sources) if self.sources else None
+
+class SemanticResponseCache:
+    """Serves stored answers for questions that are semantically close to ones already asked"""
+    
+    def __init__(self, threshold: float = None, max_entries: int = None):
+        """
+        Initialize SemanticResponseCache
+        
+        Args:
+            threshold (float): Minimum cosine similarity for a cache hit
+            max_entries (int): Maximum number of stored responses
+        """
+        self.threshold = threshold or config.cache.response_similarity_threshold
+        self.max_entries = max_entries or config.cache.response_cache_size
+        self.index = None
+        self.responses: List[Dict[str, Any]] = []
+    
+    def clear(self) -> None:
+        """Drop every stored response"""
+        self.index = None
+        self.responses = []
+    
+    def lookup(self, query_vector: np.ndarray) -> Optional[Dict[str, Any]]:
+        """
+        Find a stored response for a question embedding
+        
+        Args:
+            query_vector (np.ndarray): L2-normalized (1, dim) float32 question embedding
+            
+        Returns:
+            Optional[Dict[str, Any]]: Stored response or None on a miss
+        """
+        if self.index is None or not self.responses:
+            return None
+        
+        scores, ids = self.index.search(query_vector, 1)
+        if ids[0, 0] < 0 or scores[0, 0] < self.threshold:
+            return None
+        
+        return self.responses[ids[0, 0]]
+    
+    def add(self, query_vector: np.ndarray, response: Dict[str, Any]) -> None:
+        """
+        Store a response, evicting the oldest entry when full
+        
+        Args:
+            query_vector (np.ndarray): L2-normalized (1, dim) float32 question embedding
+            response (Dict[str, Any]): Processed response to store
+        """
+        if self.index is None:
+            self.index = faiss.IndexFlatIP(query_vector.shape[1])
+        
+        if len(self.responses) >= self.max_entries:
+            # IndexFlat renumbers after removal, keeping ids aligned with the list
+            self.index.remove_ids(np.array([0], dtype=np.int64))
+            self.responses.pop(0)
+        
+        self.index.add(query_vector)
+        self.responses.append(response)
+
 class QAChainManager:
     """Manages question answering operations using retrieval-based chains"""
     
@@ -26,6 +169,11 @@ class QAChainManager:
         self.llm = None
         self.qa_chain = None
         self.vector_store_manager = None
+        self.response_cache = SemanticResponseCache()
+        # Bound prompt formatters for the direct answer path, taken from the chain
+        self._format_prompt = None
+        self._format_document = None
+        self._document_separator = "\n\n"
         
         if self.api_key:
             self._initialize_llm()
@@ -38,10 +186,11 @@ class QAChainManager:
             bool: True if successful, False otherwise
         """
         try:
-            self.llm = GoogleGenerativeAI(
-                model=config.llm.model_name,
-                google_api_key=self.api_key,
-                temperature=config.llm.temperature
+            self.llm = _build_llm(
+                self.api_key,
+                config.llm.model_name,
+                config.llm.temperature,
+                config.llm.streaming
             )
             return True
         except Exception as e:
@@ -59,19 +208,25 @@ class QAChainManager:
             bool: True if successful, False otherwise
         """
         try:
-            if not self.llm:
-                if not self._initialize_llm():
-                    return False
-            
             if not vector_store_manager or not vector_store_manager.vector_store:
                 show_error_message(ValueError("No vector store available"), "QA Chain Setup")
                 return False
             
-            # Get retriever from vector store
+            # Swap the default flat index for the configured ANN index before anything queries it
+            vector_store_manager.optimize_index()
+            
+            # Built inline rather than on a worker thread next to get_retriever: _build_llm is
+            # cached process-wide, so this only costs anything on the first session, and
+            # get_retriever is an in-memory call with nothing to overlap
+            if not self.llm and not self._initialize_llm():
+                return False
+            
             retriever = vector_store_manager.get_retriever()
             if not retriever:
                 return False
             
+            from langchain.chains import RetrievalQAWithSourcesChain
+            
             # Create QA chain
             self.qa_chain = RetrievalQAWithSourcesChain.from_chain_type(
                 llm=self.llm,
@@ -79,9 +234,13 @@ class QAChainManager:
                 retriever=retriever,
                 return_source_documents=True
             )
+            self._bind_prompts()
             
             self.vector_store_manager = vector_store_manager
             
+            # Answers from a previous corpus no longer apply
+            self.response_cache.clear()
+            
             show_success_message("QA Chain setup completed successfully!")
             return True
             
@@ -108,24 +267,145 @@ class QAChainManager:
                 show_error_message(ValueError("Question cannot be empty"), "Question Answering")
                 return None
             
-            with st.spinner("Searching knowledge base and generating answer..."):
-                response = self.qa_chain({"question": question})
+            # Asking the same question again against the same store returns the last response as-is
+            response_key = self._response_key(question)
+            if st.session_state.get('resp_key') == response_key:
+                return st.session_state['resp_val']
+            
+            query_vector = self._embed_question(question)
+            if query_vector is not None:
+                cached_response = self.response_cache.lookup(query_vector)
+                if cached_response:
+                    self._remember_response(response_key, cached_response)
+                    return cached_response
+            
+            # Tokens render into the placeholder as they arrive, which replaces the spinner as feedback
+            placeholder = st.empty()
+            placeholder.caption("Searching knowledge base and generating answer...")
+            
+            accumulator = SourceAccumulator()
+            token_handler = StreamlitTokenHandler(placeholder)
+            callbacks = [token_handler, accumulator]
+            
+            if config.retrieval.bypass_chain and self._format_prompt:
+                response = self._answer_directly(question, callbacks)
+            else:
+                response = self.qa_chain({"question": question}, callbacks=callbacks)
+            
+            # The final answer is rendered by the caller along with its sources
+            placeholder.empty()
+            
+            # The live preview must have shown exactly the answer being returned
+            if token_handler.text and _split_sources(token_handler.text)[0] != response.get('answer'):
+                logger.warning("Streamed tokens did not add up to the final answer")
             
             # Process and format the response
-            processed_response = self._process_response(response)
+            processed_response = self._process_response(response, accumulator)
             
+            if query_vector is not None:
+                self.response_cache.add(query_vector, processed_response)
+            
+            self._remember_response(response_key, processed_response)
             return processed_response
             
         except Exception as e:
             show_error_message(e, "Question Answering")
             return None
     
-    def _process_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+    def _bind_prompts(self) -> None:
+        """Cache the chain's prompt formatters as bound methods for the direct answer path"""
+        combine_chain = self.qa_chain.combine_documents_chain
+        self._format_prompt = combine_chain.llm_chain.prompt.format
+        self._format_document = combine_chain.document_prompt.format
+        self._document_separator = combine_chain.document_separator
+    
+    def _answer_directly(self, question: str, callbacks: list) -> Dict[str, Any]:
+        """
+        Answer with a retrieve -> prompt -> LLM call, skipping the chain's wrapper layers
+        
+        Produces the same prompt and output keys as RetrievalQAWithSourcesChain with the "stuff"
+        chain type.
+        
+        Args:
+            question (str): Question to ask
+            callbacks (list): Callback handlers for retrieval and generation
+            
+        Returns:
+            Dict[str, Any]: Raw response with question, answer, sources and source_documents
+        """
+        run_config = {"callbacks": callbacks}
+        docs = self.qa_chain.retriever.invoke(question, config=run_config)
+        
+        format_document = self._format_document
+        summaries = self._document_separator.join(
+            format_document(page_content=doc.page_content, source=doc.metadata.get('source', ''))
+            for doc in docs
+        )
+        answer = self.llm.invoke(self._format_prompt(summaries=summaries, question=question), config=run_config)
+        answer, sources = _split_sources(answer)
+        
+        return {
+            'question': question,
+            'answer': answer,
+            'sources': sources,
+            'source_documents': docs
+        }
+    
+    def _response_key(self, question: str) -> str:
+        """
+        Build the session memo key for a question against the current vector store
+        
+        Args:
+            question (str): Question being asked
+            
+        Returns:
+            str: Hex digest of (question, store_id, search_k)
+        """
+        store_id = self.vector_store_manager.store_id if self.vector_store_manager else None
+        raw = f"{question}|{store_id}|{config.retrieval.search_k}".encode()
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+    
+    def _remember_response(self, key: str, response: Dict[str, Any]) -> None:
+        """
+        Store the last processed response in the session memo
+        
+        Args:
+            key (str): Key from _response_key
+            response (Dict[str, Any]): Processed response
+        """
+        st.session_state['resp_key'] = key
+        st.session_state['resp_val'] = response
+    
+    def _embed_question(self, question: str) -> Optional[np.ndarray]:
+        """
+        Embed a question for the semantic response cache
+        
+        Args:
+            question (str): Question to embed
+            
+        Returns:
+            Optional[np.ndarray]: L2-normalized (1, dim) float32 vector, or None if the cache is
+            disabled or embedding failed
+        """
+        if not config.cache.response_cache_enabled:
+            return None
+        
+        try:
+            # Through the manager's query cache, so retrieval reuses this embedding instead of
+            # requesting it again; copied because the cached vector is shared and read-only
+            query_vector = np.array(self.vector_store_manager.embed_query(question), dtype=np.float32, ndmin=2)
+            faiss.normalize_L2(query_vector)
+            return query_vector
+        except Exception:
+            return None
+    
+    def _process_response(self, response: Dict[str, Any], accumulator: SourceAccumulator = None) -> Dict[str, Any]:
         """
         Process and format the chain response
         
         Args:
             response (Dict[str, Any]): Raw response from chain
+            accumulator (SourceAccumulator): Fields precomputed during retrieval, if any
             
         Returns:
             Dict[str, Any]: Processed response
@@ -137,14 +417,20 @@ class QAChainManager:
             'question': response.get('question', '')
         }
         
-        # Format sources for better display
-        if processed['sources']:
+        # Format sources for better display, reusing the retrieval-time formatting when the
+        # LLM cited exactly the retrieved sources
+        if accumulator and accumulator.formatted_sources and processed['sources'] == accumulator.sources:
+            processed['formatted_sources'] = accumulator.formatted_sources
+        elif processed['sources']:
             processed['formatted_sources'] = format_sources(processed['sources'])
         else:
             processed['formatted_sources'] = "No sources available"
         
         # Add document count info
-        processed['num_source_docs'] = len(processed['source_documents'])
+        if accumulator and accumulator.num_source_docs is not None:
+            processed['num_source_docs'] = accumulator.num_source_docs
+        else:
+            processed['num_source_docs'] = len(processed['source_documents'])
         
         return processed
     
@@ -164,7 +450,32 @@ class QAChainManager:
                 show_error_message(ValueError("Vector store manager not available"), "Document Retrieval")
                 return []
             
-            return self.vector_store_manager.similarity_search(question, k=k)
+            # The manager stays UI-free on the search path; feedback belongs to this layer
+            with st.spinner("Searching for similar documents..."):
+                return self.vector_store_manager.similarity_search(question, k=k)
+            
+        except Exception as e:
+            show_error_message(e, "Document Retrieval")
+            return []
+    
+    def get_similar_documents_batch(self, questions: List[str], k: int = None) -> List[list]:
+        """
+        Get documents similar to several questions in one batched search
+        
+        Args:
+            questions (List[str]): Questions/queries
+            k (int): Number of documents to retrieve per question
+            
+        Returns:
+            List[list]: Similar documents for each question, in input order
+        """
+        try:
+            if not self.vector_store_manager:
+                show_error_message(ValueError("Vector store manager not available"), "Document Retrieval")
+                return []
+            
+            with st.spinner(f"Searching for documents similar to {len(questions)} queries..."):
+                return self.vector_store_manager.similarity_search_batch(questions, k=k)
             
         except Exception as e:
             show_error_message(e, "Document Retrieval")
@@ -188,7 +499,12 @@ class QAChainManager:
             
             # Update the chain with custom prompt
             if self.qa_chain:
-                self.qa_chain.combine_docs_chain.llm_chain.prompt = prompt
+                self.qa_chain.combine_documents_chain.llm_chain.prompt = prompt
+                self._bind_prompts()
+                # Cached answers were generated under the previous prompt
+                self.response_cache.clear()
+                st.session_state.pop('resp_key', None)
+                st.session_state.pop('resp_val', None)
                 show_success_message("Custom prompt applied successfully!")
                 return True
             else:
@@ -234,19 +550,23 @@ class QAChainManager:
             bool: True if successful, False otherwise
         """
         try:
+            # Cached answers were produced with a different number of retrieved documents
+            if search_k != config.retrieval.search_k:
+                self.response_cache.clear()
+            
             # Update config first
             config.retrieval.search_k = search_k
             
             # Only update the chain if both vector store manager and qa_chain exist
             if self.vector_store_manager and self.vector_store_manager.vector_store and self.qa_chain:
-                # Create new retriever with updated settings
-                retriever = self.vector_store_manager.get_retriever({"k": search_k})
-                if retriever:
-                    self.qa_chain.retriever = retriever
+                # Override k on the existing retriever instead of building a new one
+                retriever = getattr(self.qa_chain, "retriever", None)
+                if retriever is not None and hasattr(retriever, "search_kwargs"):
+                    retriever.search_kwargs["k"] = search_k
                     show_success_message(f"Updated retrieval settings - K: {search_k}")
                     return True
                 else:
-                    show_error_message(ValueError("Failed to create retriever"), "Update Settings")
+                    show_error_message(ValueError("QA chain has no configurable retriever"), "Update Settings")
                     return False
             else:
                 # Just update the config if chain isn't ready yet
@@ -4,14 +4,31 @@ Setup script for Research Tool
 Run this to install all required dependencies
 """
 
+import shutil
 import subprocess
 import sys
 import os
 
+def pip_command():
+    """Return the installer command, preferring uv when it is on PATH"""
+    if shutil.which("uv"):
+        return ["uv", "pip", "install", "--python", sys.executable]
+    return [sys.executable, "-m", "pip", "install"]
+
+def install_packages(packages):
+    """Install all packages with a single resolver run"""
+    try:
+        subprocess.check_call([*pip_command(), *packages])
+        print(f"✅ Successfully installed {len(packages)} packages")
+        return True
+    except (subprocess.CalledProcessError, OSError) as e:
+        print(f"❌ Batch install failed: {e}")
+        return False
+
 def install_package(package):
     """Install a package using pip"""
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+        subprocess.check_call([*pip_command(), package])
         print(f"✅ Successfully installed {package}")
         return True
     except subprocess.CalledProcessError as e:
@@ -25,12 +42,18 @@ def main():
     
     # List of required packages
     packages = [
-        "streamlit>=1.28.0",
+        "streamlit>=1.37.0",
         "langchain>=0.1.0", 
         "langchain-community>=0.0.20",
         "langchain-google-genai>=1.0.0",
         "google-generativeai>=0.3.0",
         "faiss-cpu>=1.7.4",
+        "aiohttp>=3.9.0",
+        "semchunk>=3.0.0",
+        "numpy>=1.24.0",
+        "blake3>=0.3.0",
+        "trafilatura>=1.6.0",
+        "msgspec>=0.18.0",
         "beautifulsoup4>=4.12.0",
         "lxml>=4.9.0",
         "requests>=2.31.0",
@@ -39,10 +62,13 @@ def main():
     
     failed_packages = []
     
-    for package in packages:
-        print(f"\n📦 Installing {package}...")
-        if not install_package(package):
-            failed_packages.append(package)
+    print(f"\n📦 Installing {len(packages)} packages...")
+    if not install_packages(packages):
+        # Fall back to one package at a time to find out which ones fail
+        for package in packages:
+            print(f"\n📦 Installing {package}...")
+            if not install_package(package):
+                failed_packages.append(package)
     
     print("\n" + "=" * 50)
     
@@ -2,12 +2,40 @@
 Streamlit UI Component for research Tool
 """
 
+import hashlib
+from functools import lru_cache
 import streamlit as st
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from config import config  # Import the instance, not the class
 from utils import truncate_text
 
 
+EXAMPLE_QUESTIONS = [
+    "What are the main risks of stock market investing?",
+    "How do I evaluate a stock before buying?",
+    "What are the current market trends mentioned?",
+    "Summarize the key points from these sources"
+]
+
+# Deterministic widget keys (hash() is salted per process), computed once at import
+_EXAMPLE_QUESTION_KEYS = [
+    (question, f"example_{hashlib.blake2b(question.encode(), digest_size=6).hexdigest()}")
+    for question in EXAMPLE_QUESTIONS
+]
+
+
+@st.cache_data(show_spinner=False)
+def _build_processed_urls_markdown(urls: Tuple[str, ...]) -> str:
+    """Build the numbered URL list once per distinct set of processed URLs"""
+    return "\n\n".join(f"**{i}.** {url}" for i, url in enumerate(urls, 1))
+
+
+@lru_cache(maxsize=2048)
+def _preview_text(content: str, max_length: int = 300) -> str:
+    """Truncate a source document's content once per distinct (content, length)"""
+    return truncate_text(content, max_length)
+
+
 class UIComponents:
 
     @staticmethod
@@ -174,8 +202,7 @@ class UIComponents:
         """Render processing status information"""
         if processed_urls:
             with st.expander("✅ Processed URLs", expanded=False):
-                for i, url in enumerate(processed_urls, 1):
-                    st.write(f"**{i}.** {url}")
+                st.markdown(_build_processed_urls_markdown(tuple(processed_urls)))
                 
                 st.success(f"Successfully processed {len(processed_urls)} URLs")
         else:
@@ -196,15 +223,8 @@ class UIComponents:
         
         # Example questions
         with st.expander("💡 Example Questions"):
-            example_questions = [
-                "What are the main risks of stock market investing?",
-                "How do I evaluate a stock before buying?",
-                "What are the current market trends mentioned?",
-                "Summarize the key points from these sources"
-            ]
-            
-            for question in example_questions:
-                if st.button(f"📝 {question}", key=f"example_{hash(question)}"):
+            for question, key in _EXAMPLE_QUESTION_KEYS:
+                if st.button(f"📝 {question}", key=key):
                     st.session_state.example_query = question
         
         # Use example query if selected
@@ -243,7 +263,7 @@ class UIComponents:
                     st.markdown(f"**Document {i}:**")
                     
                     # Show truncated content
-                    content = truncate_text(doc.page_content, 300)
+                    content = _preview_text(doc.page_content, 300)
                     st.write(content)
                     
                     # Show source if available
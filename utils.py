@@ -3,11 +3,26 @@ Utility functions for the Research Tool
 """
 
 import streamlit as st
-import google.generativeai as genai
-from urllib.parse import urlparse
 from typing import List, Tuple
 import re
 
+# Compiled once at import; http(s) scheme followed by a non-empty host
+_URL_RE = re.compile(r'^https?://[^\s/$.?#][^\s]*$', re.IGNORECASE)
+
+# clean_text patterns, compiled once at import
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\.\,\!\?\;\:\-\(\)]')
+_KEPT_PUNCTUATION = ".,!?;:-()"
+
+# ASCII characters _SPECIAL_CHARS_RE would remove, for a str.translate fast path
+_ASCII_DELETE_TABLE = {
+    i: None for i in range(128)
+    if not (chr(i).isalnum() or chr(i) == '_' or chr(i).isspace() or chr(i) in _KEPT_PUNCTUATION)
+}
+
+# Prefix for each entry in format_sources output
+_SOURCE_BULLET = "• "
+
 
 def validate_url(url: str) -> bool:
     """
@@ -19,11 +34,7 @@ def validate_url(url: str) -> bool:
     Returns:
         bool: True if URL is valid, False otherwise
     """
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except Exception:
-        return False
+    return bool(_URL_RE.match(url))
 
 def parse_urls_from_input(urls_input: str) -> List[str]:
     """
@@ -33,14 +44,13 @@ def parse_urls_from_input(urls_input: str) -> List[str]:
         urls_input (str): Multi-line string containing URLs
         
     Returns:
-        List[str]: List of cleaned URLs
+        List[str]: List of cleaned, unique URLs
     """
     if not urls_input:
         return []
     
-    # Split by newlines and clean up
-    urls = [url.strip() for url in urls_input.split('\n') if url.strip()]
-    return urls
+    # Split by newlines, clean up and drop repeated URLs, keeping the first occurrence
+    return list(dict.fromkeys(url for url in map(str.strip, urls_input.splitlines()) if url))
 
 def validate_urls(urls: List[str]) -> Tuple[List[str], List[str]]:
     """
@@ -54,15 +64,45 @@ def validate_urls(urls: List[str]) -> Tuple[List[str], List[str]]:
     """
     valid_urls = []
     invalid_urls = []
+    match = _URL_RE.match
     
     for url in urls:
-        if validate_url(url):
+        if match(url):
             valid_urls.append(url)
         else:
             invalid_urls.append(url)
     
     return valid_urls, invalid_urls
 
+def parse_and_validate(urls_input: str) -> Tuple[List[str], List[str]]:
+    """
+    Parse, validate and deduplicate URLs from multi-line input in a single pass
+    
+    Args:
+        urls_input (str): Multi-line string containing URLs
+        
+    Returns:
+        Tuple[List[str], List[str]]: (valid_urls, invalid_urls), each unique and in input order
+    """
+    if not urls_input:
+        return [], []
+    
+    # Dicts double as insertion-ordered sets, so duplicates are dropped without a second pass
+    valid_urls = {}
+    invalid_urls = {}
+    match = _URL_RE.match
+    
+    for line in urls_input.splitlines():
+        url = line.strip()
+        if not url:
+            continue
+        if match(url):
+            valid_urls.setdefault(url, None)
+        else:
+            invalid_urls.setdefault(url, None)
+    
+    return list(valid_urls), list(invalid_urls)
+
 def setup_gemini_api(api_key: str) -> bool:
     """
     Setup Gemini API with the provided key
@@ -74,6 +114,9 @@ def setup_gemini_api(api_key: str) -> bool:
         bool: True if setup successful, False otherwise
     """
     try:
+        # Imported here so sessions that never configure the API skip loading the client stack
+        import google.generativeai as genai
+        
         genai.configure(api_key=api_key)
         return True
     except Exception as e:
@@ -94,9 +137,12 @@ def clean_text(text: str) -> str:
         return ""
     
     # Remove extra whitespaces
-    text = re.sub(r'\s+', ' ', text)
-    # Remove special characters but keep basic punctuation
-    text = re.sub(r'[^\w\s\.\,\!\?\;\:\-\(\)]', '', text)
+    text = _WHITESPACE_RE.sub(' ', text)
+    # Remove special characters but keep basic punctuation; translate runs in C for ASCII text
+    if text.isascii():
+        text = text.translate(_ASCII_DELETE_TABLE)
+    else:
+        text = _SPECIAL_CHARS_RE.sub('', text)
     
     return text.strip()
 
@@ -130,16 +176,16 @@ def format_sources(sources: str) -> str:
     if not sources:
         return "No sources available"
     
-    # Split by common delimiters and clean up
-    source_list = re.split(r'[,;]', sources)
-    formatted_sources = []
+    # Single source (the common case): nothing to split
+    if ',' not in sources and ';' not in sources:
+        source = sources.strip()
+        return _SOURCE_BULLET + source if source else sources
     
-    for source in source_list:
-        source = source.strip()
-        if source:
-            formatted_sources.append(f"• {source}")
+    # Split by common delimiters with plain str methods and clean up
+    source_list = (source.strip() for source in sources.replace(';', ',').split(','))
+    formatted_sources = '\n'.join(_SOURCE_BULLET + source for source in source_list if source)
     
-    return '\n'.join(formatted_sources) if formatted_sources else sources
+    return formatted_sources or sources
 
 def display_processing_stats(num_chunks: int, num_documents: int, num_urls: int) -> None:
     """
@@ -2,16 +2,299 @@
 Vector store management module for embeddings and similarity search
 """
 
+import json
+import logging
+import math
+import mmap
+import pickle
+import shutil
+import tempfile
+import uuid
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+import faiss
+import numpy as np
 import streamlit as st
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
+from langchain_community.docstore.base import AddableMixin, Docstore
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStoreRetriever
 from langchain.schema import Document
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 import os
 
 from config import config
 from utils import show_error_message, show_success_message
 
+logger = logging.getLogger(__name__)
+
+def _fsync(path: str) -> None:
+    """
+    Flush a file, or a directory's entries, to disk
+    
+    Args:
+        path (str): File or directory; directories are skipped off POSIX, where they cannot be opened
+    """
+    if os.name != "posix" and os.path.isdir(path):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _recover_interrupted_save(path: str) -> None:
+    """
+    Finish a save_vector_store swap that was interrupted after the previous store was moved aside
+    
+    Args:
+        path (str): Normalized store path
+    """
+    old_path = path + ".old"
+    if not os.path.exists(path) and os.path.isdir(old_path):
+        # The previous store is the only complete copy; put it back before anything is cleaned up
+        os.replace(old_path, path)
+        _fsync(os.path.dirname(os.path.abspath(path)))
+
+class SimilarityLRUCache:
+    """SIM-LRU cache: serves stored neighbours for queries whose embedding is close to a cached one"""
+    
+    def __init__(self, max_entries: int = None, k_prime: int = None, threshold: float = None):
+        """
+        Initialize SimilarityLRUCache
+        
+        Args:
+            max_entries (int): Maximum number of cached queries
+            k_prime (int): Neighbours stored per query, the largest k that can be served
+            threshold (float): Maximum L2 distance between unit query vectors for a hit
+        """
+        self.max_entries = max_entries or config.cache.search_cache_size
+        self.k_prime = k_prime or config.cache.search_cache_k_prime
+        self.threshold = threshold if threshold is not None else config.cache.search_cache_threshold
+        # Most recently used first; keys and results stay aligned
+        self.keys = None
+        self.results: List[List[Tuple[Document, float]]] = []
+    
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        self.keys = None
+        self.results = []
+    
+    @staticmethod
+    def _as_key(query_vector: np.ndarray) -> np.ndarray:
+        """Normalize a query embedding so the threshold is independent of vector scale"""
+        key = np.array(query_vector, dtype=np.float32, ndmin=2)
+        faiss.normalize_L2(key)
+        return key
+    
+    def lookup(self, query_vector: np.ndarray, k: int) -> Optional[List[Tuple[Document, float]]]:
+        """
+        Find cached neighbours for a query embedding, moving the hit to the front
+        
+        Args:
+            query_vector (np.ndarray): Query embedding
+            k (int): Number of neighbours wanted
+            
+        Returns:
+            Optional[List[Tuple[Document, float]]]: Top-k (document, score) pairs or None on a miss
+        """
+        if not self.results or k > self.k_prime:
+            return None
+        
+        distances = np.linalg.norm(self.keys - self._as_key(query_vector), axis=1)
+        best = int(np.argmin(distances))
+        if distances[best] > self.threshold:
+            return None
+        
+        if best:
+            order = [best, *range(best), *range(best + 1, len(self.results))]
+            self.keys = self.keys[order]
+            self.results.insert(0, self.results.pop(best))
+        
+        return self.results[0][:k]
+    
+    def add(self, query_vector: np.ndarray, results: List[Tuple[Document, float]]) -> None:
+        """
+        Insert a query's k' neighbours at the front, evicting the least recently used entry
+        
+        Args:
+            query_vector (np.ndarray): Query embedding
+            results (List[Tuple[Document, float]]): (document, score) pairs, best first
+        """
+        key = self._as_key(query_vector)
+        self.keys = key if self.keys is None else np.vstack([key, self.keys[:self.max_entries - 1]])
+        self.results.insert(0, results)
+        del self.results[self.max_entries:]
+
+class MMapDocstore(Docstore, AddableMixin):
+    """
+    Append-only docstore keeping documents as JSON lines in a memory-mapped file, so chunk texts
+    stay off the Python heap and only the documents a search returns are decoded.
+    Document ids are row numbers in the file, resolved through an int64 offsets array.
+    """
+    
+    DATA_FILE = "docstore.jsonl"
+    OFFSETS_FILE = "docstore_offsets.npy"
+    
+    def __init__(self, directory: str = None, readonly: bool = False):
+        """
+        Initialize MMapDocstore
+        
+        Args:
+            directory (str): Directory a docstore was saved to; None starts an empty docstore
+            readonly (bool): Map the saved file in place instead of copying it into a private,
+                appendable file; add() is then refused
+        """
+        self.readonly = readonly and directory is not None
+        self._mmap = None
+        
+        if self.readonly:
+            self._file = open(os.path.join(directory, self.DATA_FILE), "rb")
+            self.offsets = np.load(os.path.join(directory, self.OFFSETS_FILE), mmap_mode="r")
+            return
+        
+        # Deleted as soon as it is closed, so abandoned stores never pile up in the cache directory
+        os.makedirs(config.cache.directory, exist_ok=True)
+        self._file = tempfile.TemporaryFile(dir=config.cache.directory, suffix=".jsonl")
+        self.offsets = np.zeros(1, dtype=np.int64)
+        if directory is not None:
+            with open(os.path.join(directory, self.DATA_FILE), "rb") as f:
+                shutil.copyfileobj(f, self._file)
+            self.offsets = np.load(os.path.join(directory, self.OFFSETS_FILE))
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    def next_ids(self, count: int) -> List[str]:
+        """Ids the next count documents must be added under"""
+        return [str(row) for row in range(len(self), len(self) + count)]
+    
+    def add(self, texts: Dict[str, Document]) -> None:
+        """
+        Append documents to the end of the file
+        
+        Args:
+            texts (Dict[str, Document]): Documents keyed by the ids from next_ids
+        """
+        if self.readonly:
+            raise ValueError("Docstore was loaded read-only")
+        if list(texts) != self.next_ids(len(texts)):
+            raise ValueError("MMapDocstore ids must be the row numbers returned by next_ids")
+        
+        lines = [
+            (json.dumps({"page_content": doc.page_content, "metadata": doc.metadata}, default=str) + "\n").encode()
+            for doc in texts.values()
+        ]
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(b"".join(lines))
+        self._file.flush()
+        ends = self.offsets[-1] + np.cumsum([len(line) for line in lines], dtype=np.int64)
+        self.offsets = np.concatenate([self.offsets, ends])
+    
+    def search(self, search: str) -> Union[str, Document]:
+        """
+        Decode the document stored under an id
+        
+        Args:
+            search (str): Document id
+            
+        Returns:
+            Union[str, Document]: Document, or a not-found message like InMemoryDocstore's
+        """
+        row = int(search) if search.isdigit() else -1
+        if not 0 <= row < len(self):
+            return f"ID {search} not found."
+        
+        start, end = int(self.offsets[row]), int(self.offsets[row + 1])
+        # A mapping only covers the file as it was when created; remap after appends
+        if self._mmap is None or end > len(self._mmap):
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return Document(**json.loads(self._mmap[start:end]))
+    
+    def delete(self, ids: List) -> None:
+        """Rows are never reclaimed; FAISS.delete drops the ids from its mapping, leaving them unreachable"""
+    
+    def save(self, directory: str) -> None:
+        """
+        Write the documents and offsets to a directory, in the layout __init__ reads
+        
+        Args:
+            directory (str): Existing directory to write into
+        """
+        self._file.seek(0)
+        with open(os.path.join(directory, self.DATA_FILE), "wb") as f:
+            shutil.copyfileobj(self._file, f)
+        np.save(os.path.join(directory, self.OFFSETS_FILE), self.offsets)
+    
+    def writable_copy(self) -> "MMapDocstore":
+        """
+        Copy the documents into a new, appendable docstore
+        
+        Returns:
+            MMapDocstore: Writable docstore holding the same rows under the same ids
+        """
+        copy = MMapDocstore()
+        self._file.seek(0)
+        shutil.copyfileobj(self._file, copy._file)
+        copy.offsets = np.array(self.offsets)
+        return copy
+    
+    def close(self) -> None:
+        """Release the memory map and the file behind it; safe to call more than once"""
+        # The mapping must go first, the file cannot be released while a view of it is open
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if not self._file.closed:
+            self._file.close()
+
+class CachedQueryEmbeddings(Embeddings):
+    """
+    Embeddings handed to LangChain's FAISS wrapper, so retrievers and chains embed queries through
+    the manager's query cache and the embeddings client is only created once something is embedded
+    """
+    
+    def __init__(self, manager: "VectorStoreManager"):
+        """
+        Initialize CachedQueryEmbeddings
+        
+        Args:
+            manager (VectorStoreManager): Manager owning the embeddings client and query cache
+        """
+        self.manager = manager
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents with the manager's client"""
+        return self.manager.embeddings.embed_documents(texts)
+    
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query through the manager's LRU cache"""
+        return self.manager.embed_query(text).tolist()
+
+class ManagedRetriever(VectorStoreRetriever):
+    """
+    Retriever that searches through its VectorStoreManager, applying its own nprobe/efSearch on
+    every search, since the index they tune is shared with every other search on the manager
+    """
+    
+    manager: Any = None
+    nprobe: Optional[int] = None
+    ef_search: Optional[int] = None
+    
+    def _get_relevant_documents(self, query: str, *, run_manager, **kwargs: Any) -> List[Document]:
+        """Retrieve documents, via the manager's caches for plain top-k similarity search"""
+        if self.search_type != "similarity" or (set(self.search_kwargs) | set(kwargs)) - {"k"}:
+            # Filters and the other search types are LangChain's; only the index knobs are ours
+            self.manager._apply_runtime_params(nprobe=self.nprobe, ef_search=self.ef_search)
+            return super()._get_relevant_documents(query, run_manager=run_manager, **kwargs)
+        
+        k = kwargs.get("k", self.search_kwargs.get("k", config.retrieval.search_k))
+        results = self.manager._cached_search_with_scores(query, k, nprobe=self.nprobe, ef_search=self.ef_search)
+        return [doc for doc, _ in results]
+
 class VectorStoreManager:
     """Manages vector store operations including embeddings and similarity search"""
     
@@ -23,28 +306,38 @@ class VectorStoreManager:
             api_key (str): Google API key for embeddings
         """
         self.api_key = api_key or config.get_api_key()
-        self.embeddings = None
         self.vector_store = None
-        
-        if self.api_key:
-            self._initialize_embeddings()
+        # Changes whenever vector_store is replaced, so per-store caches never outlive their store
+        self.store_id = None
+        self.search_cache = SimilarityLRUCache()
+        # Held for as long as a single-GPU index uses it; freeing it invalidates the index
+        self._gpu_resources = None
+        self._on_gpu = False
+        # Set for stores loaded as shared read-only memory maps; add_documents is refused
+        self.read_only = False
+        # Per-instance LRU over query strings, shared by every search path and the QA response cache;
+        # built here so the cache does not pin the class
+        self.embed_query = lru_cache(maxsize=config.embedding.query_cache_size)(self._embed_query_uncached)
     
-    def _initialize_embeddings(self) -> bool:
+    @cached_property
+    def embeddings(self) -> "GoogleGenerativeAIEmbeddings":
         """
-        Initialize Google Generative AI embeddings
+        Google Generative AI embeddings, created on first use so managers that never embed
+        (inspection, saving) skip building the API client
         
         Returns:
-            bool: True if successful, False otherwise
+            GoogleGenerativeAIEmbeddings: Embeddings client
+            
+        Raises:
+            Exception: If the client cannot be created; nothing is cached, so the next access retries
         """
-        try:
-            self.embeddings = GoogleGenerativeAIEmbeddings(
-                model=config.embedding.model_name,
-                google_api_key=self.api_key
-            )
-            return True
-        except Exception as e:
-            show_error_message(e, "Embeddings Initialization")
-            return False
+        # Imported here so the client stack is only loaded once something needs embeddings
+        from langchain_google_genai import GoogleGenerativeAIEmbeddings
+        
+        return GoogleGenerativeAIEmbeddings(
+            model=config.embedding.model_name,
+            google_api_key=self.api_key
+        )
     
     def create_vector_store(self, documents: List[Document]) -> Optional[FAISS]:
         """
@@ -61,15 +354,19 @@ class VectorStoreManager:
                 show_error_message(ValueError("No documents provided"), "Vector Store Creation")
                 return None
             
-            if not self.embeddings:
-                if not self._initialize_embeddings():
-                    return None
+            # Pulled out once; every later stage indexes these lists instead of the Documents
+            texts = [doc.page_content for doc in documents]
+            metadatas = [doc.metadata for doc in documents]
             
             with st.spinner("Creating embeddings and building vector store..."):
-                # Create vector store from documents
-                vector_store = FAISS.from_documents(documents, self.embeddings)
+                vector_store = self._build_store(texts, metadatas)
             
+            self._close_docstore()
             self.vector_store = vector_store
+            self.store_id = uuid.uuid4().hex
+            self.search_cache.clear()
+            self.read_only = False
+            self._move_index_to_gpu()
             
             show_success_message(
                 "Vector store created successfully!",
@@ -82,6 +379,249 @@ class VectorStoreManager:
             show_error_message(e, "Vector Store Creation")
             return None
     
+    def _wrap_index(self, index, docstore, index_to_docstore_id: dict) -> FAISS:
+        """
+        Wrap a FAISS index in LangChain's vector store, deriving the distance strategy from its metric
+        
+        Args:
+            index (faiss.Index): Populated index
+            docstore: Docstore holding the documents
+            index_to_docstore_id (dict): Index row to docstore id mapping
+            
+        Returns:
+            FAISS: Vector store
+        """
+        # With normalize_L2 set, LangChain also normalizes queries and later additions
+        use_inner_product = index.metric_type == faiss.METRIC_INNER_PRODUCT
+        with warnings.catch_warnings():
+            # LangChain warns that normalizing only suits Euclidean distance, but unit vectors are
+            # exactly what makes inner product a cosine similarity here
+            warnings.filterwarnings("ignore", message="Normalizing L2 is not applicable", category=UserWarning)
+            return FAISS(
+                embedding_function=CachedQueryEmbeddings(self),
+                index=index,
+                docstore=docstore,
+                index_to_docstore_id=index_to_docstore_id,
+                normalize_L2=use_inner_product,
+                distance_strategy=(
+                    DistanceStrategy.MAX_INNER_PRODUCT if use_inner_product
+                    else DistanceStrategy.EUCLIDEAN_DISTANCE
+                )
+            )
+    
+    def _build_store(self, texts: List[str], metadatas: List[dict]) -> FAISS:
+        """
+        Embed texts group by group straight into a new index, so only the training sample
+        and one group of vectors are ever held in memory
+        
+        Args:
+            texts (List[str]): Document contents to vectorize
+            metadatas (List[dict]): Metadata for each text
+            
+        Returns:
+            FAISS: Vector store with the same docstore layout FAISS.from_texts produces
+        """
+        num_docs = len(texts)
+        # On unit vectors inner product equals cosine similarity and skips L2's subtraction
+        use_inner_product = config.retrieval.use_inner_product
+        metric = faiss.METRIC_INNER_PRODUCT if use_inner_product else faiss.METRIC_L2
+        group_size = config.embedding.batch_size * config.embedding.max_concurrency
+        
+        # Shuffled so the leading slice doubles as an unbiased training sample
+        order = np.random.default_rng(0).permutation(num_docs)
+        
+        def embed(positions: np.ndarray) -> np.ndarray:
+            vectors = self._embed_texts([texts[i] for i in positions])
+            if use_inner_product:
+                faiss.normalize_L2(vectors)
+            return vectors
+        
+        # The first batch fixes the dimensionality, which the index spec depends on
+        vectors = embed(order[:config.embedding.batch_size])
+        dim = vectors.shape[1]
+        index = faiss.index_factory(dim, self._index_spec(num_docs, dim), metric)
+        
+        if not index.is_trained:
+            train_size = self._training_size(index, num_docs)
+            if train_size > len(vectors):
+                vectors = np.vstack([vectors, embed(order[len(vectors):train_size])])
+            index.train(vectors)
+        
+        use_mmap_docstore = config.retrieval.mmap_docstore
+        docstore = MMapDocstore() if use_mmap_docstore else InMemoryDocstore()
+        index_to_docstore_id = {}
+        position = 0
+        while True:
+            index.add(vectors)
+            rows = order[position:position + len(vectors)]
+            ids = docstore.next_ids(len(rows)) if use_mmap_docstore else [str(uuid.uuid4()) for _ in rows]
+            docstore.add({
+                doc_id: Document(page_content=texts[doc_index], metadata=metadatas[doc_index])
+                for doc_id, doc_index in zip(ids, rows)
+            })
+            index_to_docstore_id.update(zip(range(position, position + len(rows)), ids))
+            
+            position += len(vectors)
+            if position >= num_docs:
+                break
+            # Rebinding releases the previous group before the next one is fetched
+            vectors = None
+            vectors = embed(order[position:position + group_size])
+        
+        self._apply_runtime_params(index)
+        return self._wrap_index(index, docstore, index_to_docstore_id)
+    
+    @staticmethod
+    def _training_size(index, num_vectors: int) -> int:
+        """
+        Number of vectors to train an index on
+        
+        Args:
+            index (faiss.Index): Untrained index
+            num_vectors (int): Corpus size
+            
+        Returns:
+            int: ~50 points per IVF centroid or PQ codeword (256 under an OPQ rotation), capped at the corpus
+        """
+        ivf_index = faiss.try_extract_index_ivf(index)
+        if ivf_index is None:
+            # Non-IVF encoders (e.g. SQ8 value ranges) are only used for corpora too small to need sampling
+            return num_vectors
+        
+        centroids = ivf_index.nlist
+        if isinstance(ivf_index, faiss.IndexIVFPQ):
+            centroids = max(centroids, ivf_index.pq.ksub)
+        
+        # A learned OPQ rotation needs a larger sample to converge
+        points_per_centroid = 256 if isinstance(index, faiss.IndexPreTransform) else 50
+        return min(num_vectors, points_per_centroid * centroids)
+    
+    def _embed_texts(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts in fixed-size batches, with several batch requests in flight at once
+        
+        Args:
+            texts (List[str]): Texts to embed
+            
+        Returns:
+            np.ndarray: (len(texts), dim) float32 embeddings in input order
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        
+        batch_size = config.embedding.batch_size
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        vectors = None
+        
+        def embed_batch(batch: List[str]) -> List[List[float]]:
+            return self.embeddings.embed_documents(batch, batch_size=batch_size)
+        
+        def fill(start: int, batch_vectors: List[List[float]]) -> None:
+            # One C-contiguous buffer, sized once the first batch reveals the dimensionality, so
+            # FAISS takes the arrays as-is and no list of every vector is ever built
+            nonlocal vectors
+            if vectors is None:
+                vectors = np.empty((len(texts), len(batch_vectors[0])), dtype=np.float32)
+            vectors[start:start + len(batch_vectors)] = batch_vectors
+        
+        if len(batches) == 1:
+            fill(0, embed_batch(batches[0]))
+        else:
+            # The pool size bounds concurrent requests; map keeps the batches in order
+            with ThreadPoolExecutor(max_workers=config.embedding.max_concurrency) as executor:
+                for start, batch_vectors in zip(range(0, len(texts), batch_size), executor.map(embed_batch, batches)):
+                    fill(start, batch_vectors)
+        
+        return vectors
+    
+    def _index_spec(self, num_vectors: int, dim: int) -> str:
+        """
+        Resolve config.retrieval.index_type into a faiss.index_factory spec for this corpus
+        
+        Args:
+            num_vectors (int): Number of vectors to index
+            dim (int): Vector dimensionality
+            
+        Returns:
+            str: index_factory spec
+        """
+        retrieval = config.retrieval
+        if retrieval.index_type != "IVF":
+            return retrieval.index_type
+        
+        quantizer = retrieval.quantizer
+        if quantizer not in ("none", "sq8", "pq"):
+            raise ValueError(f"Unknown quantizer '{quantizer}', expected 'none', 'sq8' or 'pq'")
+        
+        nlist = retrieval.ivf_nlist or max(64, int(math.sqrt(num_vectors)))
+        
+        # k-means wants ~39 training points per centroid, for the coarse and the PQ codebooks alike.
+        # Below that an exact scan of so few vectors is cheap, and quantizing them saves little
+        centroids = max(nlist, 2 ** retrieval.pq_nbits) if quantizer == "pq" else nlist
+        if num_vectors < 39 * centroids:
+            return "Flat"
+        
+        if quantizer == "none":
+            return f"IVF{nlist},Flat"
+        if quantizer == "sq8":
+            return f"IVF{nlist},SQ8"
+        
+        m = min(retrieval.pq_m or max(1, dim // 8), dim)
+        while dim % m:
+            m -= 1
+        
+        if retrieval.pq_opq:
+            # The rotation decorrelates dimensions before they are split into PQ sub-vectors
+            return f"OPQ{m},IVF{nlist}_HNSW32,PQ{m}x{retrieval.pq_nbits}"
+        return f"IVF{nlist},PQ{m}x{retrieval.pq_nbits}"
+    
+    def _build_index(self, vectors: np.ndarray, metric: int = faiss.METRIC_L2):
+        """
+        Build, train and fill the configured FAISS index
+        
+        Args:
+            vectors (np.ndarray): (N, dim) float32 vectors, in docstore order
+            metric (int): FAISS metric type
+            
+        Returns:
+            faiss.Index: Populated index
+        """
+        spec = self._index_spec(*vectors.shape)
+        index = faiss.index_factory(vectors.shape[1], spec, metric)
+        if not index.is_trained:
+            index.train(vectors)
+        index.add(vectors)
+        
+        self._apply_runtime_params(index)
+        return index
+    
+    def _apply_runtime_params(self, index=None, nprobe: int = None, ef_search: int = None) -> None:
+        """
+        Set the query-time speed/recall knobs on the index (IVF nprobe, HNSW efSearch)
+        
+        Args:
+            index (faiss.Index): Index to tune; defaults to the current vector store's index
+            nprobe (int): IVF lists to scan; defaults to config.retrieval.nprobe
+            ef_search (int): HNSW candidate list size; defaults to config.retrieval.ef_search
+        """
+        index = index if index is not None else self.vector_store.index
+        nprobe = nprobe or config.retrieval.nprobe
+        ef_search = ef_search or config.retrieval.ef_search
+        
+        # try_extract_index_ivf also sees through pre-transform wrappers; GPU IVF indexes expose nprobe directly
+        ivf_index = faiss.try_extract_index_ivf(index)
+        if ivf_index is not None:
+            ivf_index.nprobe = nprobe
+            # An HNSW coarse quantizer has its own search breadth for picking the lists
+            quantizer = faiss.downcast_index(ivf_index.quantizer)
+            if isinstance(quantizer, faiss.IndexHNSW):
+                quantizer.hnsw.efSearch = ef_search
+        elif hasattr(index, "nprobe"):
+            index.nprobe = nprobe
+        
+        if isinstance(index, faiss.IndexHNSW):
+            index.hnsw.efSearch = ef_search
+    
     def add_documents(self, documents: List[Document]) -> bool:
         """
         Add more documents to existing vector store
@@ -101,8 +641,27 @@ class VectorStoreManager:
                 show_error_message(ValueError("No documents provided"), "Adding Documents")
                 return False
             
+            if self.read_only:
+                show_error_message(
+                    ValueError("Vector store was loaded read-only; load it with readonly=False to add documents"),
+                    "Adding Documents"
+                )
+                return False
+            
             with st.spinner("Adding new documents to vector store..."):
-                self.vector_store.add_documents(documents)
+                texts = [doc.page_content for doc in documents]
+                vectors = self._embed_texts(texts)
+                docstore = self.vector_store.docstore
+                self.vector_store.add_embeddings(
+                    # Rows go in as float32 arrays; LangChain stacks them without a Python float round-trip
+                    zip(texts, vectors),
+                    metadatas=[doc.metadata for doc in documents],
+                    # MMapDocstore ids are row numbers; None lets LangChain generate uuids
+                    ids=docstore.next_ids(len(texts)) if isinstance(docstore, MMapDocstore) else None
+                )
+            
+            # Cached neighbour lists may now miss closer new documents
+            self.search_cache.clear()
             
             show_success_message(f"Added {len(documents)} documents to vector store")
             return True
@@ -124,18 +683,15 @@ class VectorStoreManager:
         """
         try:
             if not self.vector_store:
-                show_error_message(ValueError("No vector store available"), "Similarity Search")
+                logger.error("Similarity search called with no vector store available")
                 return []
             
             k = k or config.retrieval.search_k
+            results = self._cached_search_with_scores(query, k)
+            return [doc for doc, _ in results]
             
-            with st.spinner(f"Searching for similar documents..."):
-                results = self.vector_store.similarity_search(query, k=k)
-            
-            return results
-            
-        except Exception as e:
-            show_error_message(e, "Similarity Search")
+        except Exception:
+            logger.exception("Similarity search failed")
             return []
     
     def similarity_search_with_scores(self, query: str, k: int = None) -> List[Tuple[Document, float]]:
@@ -151,20 +707,226 @@ class VectorStoreManager:
         """
         try:
             if not self.vector_store:
-                show_error_message(ValueError("No vector store available"), "Similarity Search")
+                logger.error("Similarity search with scores called with no vector store available")
                 return []
             
             k = k or config.retrieval.search_k
+            return self._cached_search_with_scores(query, k)
             
-            with st.spinner("Searching with relevance scores..."):
-                results = self.vector_store.similarity_search_with_score(query, k=k)
+        except Exception:
+            logger.exception("Similarity search with scores failed")
+            return []
+    
+    def _embed_query_uncached(self, query: str) -> np.ndarray:
+        """
+        Embed a search query
+        
+        Args:
+            query (str): Search query
             
-            return results
+        Returns:
+            np.ndarray: Read-only float32 query embedding (shared between cache hits)
+        """
+        query_vector = np.asarray(self.embeddings.embed_query(query), dtype=np.float32)
+        query_vector.setflags(write=False)
+        return query_vector
+    
+    def _cached_search_with_scores(
+        self,
+        query: str,
+        k: int,
+        nprobe: int = None,
+        ef_search: int = None
+    ) -> List[Tuple[Document, float]]:
+        """
+        Search through the SIM-LRU cache, fetching k' neighbours from FAISS on a miss
+        
+        Args:
+            query (str): Search query
+            k (int): Number of results to return
+            nprobe (int): IVF lists to scan; defaults to config.retrieval.nprobe
+            ef_search (int): HNSW candidate list size; defaults to config.retrieval.ef_search
             
-        except Exception as e:
-            show_error_message(e, "Similarity Search with Scores")
+        Returns:
+            List[Tuple[Document, float]]: Documents with similarity scores
+        """
+        # One embedding per distinct query string, whichever search variant asks for it
+        query_vector = self.embed_query(query)
+        self._apply_runtime_params(nprobe=nprobe, ef_search=ef_search)
+        
+        # Cached neighbours were found with the default knobs, so overridden searches skip the cache
+        if not config.cache.search_cache_enabled or nprobe or ef_search:
+            return self.vector_store.similarity_search_with_score_by_vector(query_vector, k=k)
+        
+        cached = self.search_cache.lookup(query_vector, k)
+        if cached is not None:
+            return cached
+        
+        # Fetch extra neighbours so the entry can also serve larger k for similar queries
+        fetch_k = max(k, self.search_cache.k_prime)
+        results = self.vector_store.similarity_search_with_score_by_vector(query_vector, k=fetch_k)
+        self.search_cache.add(query_vector, results)
+        
+        return results[:k]
+    
+    def similarity_search_batch(self, queries: List[str], k: int = None) -> List[List[Document]]:
+        """
+        Perform similarity search for several queries with one FAISS search
+        
+        Args:
+            queries (List[str]): Search queries
+            k (int): Number of results to return per query
+            
+        Returns:
+            List[List[Document]]: Similar documents for each query, in input order; ids missing
+                from the docstore are skipped
+        """
+        return [
+            [doc for doc, _ in results]
+            for results in self.similarity_search_batch_with_scores(queries, k=k)
+        ]
+    
+    def similarity_search_batch_with_scores(self, queries: List[str], k: int = None) -> List[List[Tuple[Document, float]]]:
+        """
+        Perform scored similarity search for several queries with one FAISS search
+        
+        Args:
+            queries (List[str]): Search queries; each distinct query is embedded through the query cache
+            k (int): Number of results to return per query
+            
+        Returns:
+            List[List[Tuple[Document, float]]]: Documents with scores for each query, in input order;
+                ids missing from the docstore are skipped
+        """
+        try:
+            if not self.vector_store:
+                logger.error("Batch similarity search called with no vector store available")
+                return []
+            
+            if not queries:
+                return []
+            
+            k = k or config.retrieval.search_k
+            unique_queries = list(dict.fromkeys(queries))
+            
+            # Shares embeddings with single searches and the chain, so repeated questions cost no API call
+            query_vectors = np.vstack([self.embed_query(query) for query in unique_queries])
+            if getattr(self.vector_store, "_normalize_L2", False):
+                faiss.normalize_L2(query_vectors)
+            
+            # One (n_queries, dim) search lets FAISS run a single batched kernel
+            self._apply_runtime_params()
+            scores, indices = self.vector_store.index.search(query_vectors, k)
+            
+            docstore = self.vector_store.docstore
+            index_to_id = self.vector_store.index_to_docstore_id
+            results = {}
+            for query, row_indices, row_scores in zip(unique_queries, indices, scores):
+                hits = []
+                for i, score in zip(row_indices, row_scores):
+                    # -1 pads short result lists; a failed lookup returns a message instead of a Document
+                    doc = docstore.search(index_to_id[i]) if i != -1 else None
+                    if isinstance(doc, Document):
+                        hits.append((doc, float(score)))
+                results[query] = hits
+            
+            return [results[query] for query in queries]
+            
+        except Exception:
+            logger.exception("Batch similarity search failed")
             return []
     
+    def _close_docstore(self) -> None:
+        """Close the current store's memory-mapped docstore before the store is replaced"""
+        docstore = self.vector_store.docstore if self.vector_store else None
+        if isinstance(docstore, MMapDocstore):
+            docstore.close()
+    
+    @staticmethod
+    def _has_hnsw(index) -> bool:
+        """Whether an index, after any OPQ transform, is or is coarse-quantized by an HNSW graph"""
+        if isinstance(index, faiss.IndexPreTransform):
+            index = faiss.downcast_index(index.index)
+        ivf = faiss.try_extract_index_ivf(index)
+        if ivf is not None:
+            index = faiss.downcast_index(ivf.quantizer)
+        return isinstance(index, faiss.IndexHNSW)
+    
+    def _move_index_to_gpu(self) -> bool:
+        """
+        Move a freshly built or loaded CPU index to the available GPU(s), keeping it on CPU if
+        that is not possible
+        
+        Returns:
+            bool: True if the index now lives on GPU, False otherwise
+        """
+        self._on_gpu = False
+        if not config.retrieval.use_gpu or not hasattr(faiss, "StandardGpuResources"):
+            return False
+        
+        num_gpus = faiss.get_num_gpus()
+        if not num_gpus:
+            return False
+        
+        index = self.vector_store.index
+        if self._has_hnsw(index):
+            # faiss has no GPU HNSW, neither as the index nor as an IVF coarse quantizer
+            return False
+        
+        try:
+            if num_gpus > 1:
+                gpu_index = faiss.index_cpu_to_all_gpus(index)
+                self._gpu_resources = None
+            else:
+                self._gpu_resources = self._gpu_resources or faiss.StandardGpuResources()
+                gpu_index = faiss.index_cpu_to_gpu(self._gpu_resources, 0, index)
+        except Exception:
+            # e.g. CUDA out of memory
+            logger.warning("GPU offload failed, searching on CPU", exc_info=True)
+            return False
+        
+        self.vector_store.index = gpu_index
+        self._on_gpu = True
+        return True
+    
+    def optimize_index(self) -> bool:
+        """
+        Rebuild a flat FAISS index (e.g. one loaded from disk) as the configured index type
+        
+        Returns:
+            bool: True if the index was rebuilt, False otherwise
+        """
+        try:
+            if not self.vector_store:
+                return False
+            
+            index = self.vector_store.index
+            if not type(index).__name__.startswith("IndexFlat") or not index.ntotal:
+                return False
+            if self._index_spec(index.ntotal, index.d) == "Flat":
+                return False
+            
+            with st.spinner("Building search index..."):
+                vectors = index.reconstruct_n(0, index.ntotal)
+                new_index = self._build_index(vectors, index.metric_type)
+            
+            # Row order is preserved, so index_to_docstore_id stays valid
+            self.vector_store.index = new_index
+            
+            # The rebuilt index lives in memory, so a read-only load becomes appendable again
+            if self.read_only:
+                docstore = self.vector_store.docstore
+                if isinstance(docstore, MMapDocstore) and docstore.readonly:
+                    self.vector_store.docstore = docstore.writable_copy()
+                    docstore.close()
+                self.read_only = False
+            self._move_index_to_gpu()
+            return True
+            
+        except Exception as e:
+            show_error_message(e, "Index Rebuild")
+            return False
+    
     def get_retriever(self, search_kwargs: dict = None):
         """
         Get retriever for use with chains
@@ -180,8 +942,19 @@ class VectorStoreManager:
                 show_error_message(ValueError("No vector store available"), "Retriever Creation")
                 return None
             
-            search_kwargs = search_kwargs or {"k": config.retrieval.search_k}
-            return self.vector_store.as_retriever(search_kwargs=search_kwargs)
+            search_kwargs = dict(search_kwargs or {"k": config.retrieval.search_k})
+            
+            # nprobe/ef_search tune the index rather than each search call, so the retriever keeps
+            # them and re-applies them on every search it runs
+            nprobe = search_kwargs.pop("nprobe", None)
+            ef_search = search_kwargs.pop("ef_search", None)
+            return ManagedRetriever(
+                vectorstore=self.vector_store,
+                search_kwargs=search_kwargs,
+                manager=self,
+                nprobe=nprobe,
+                ef_search=ef_search
+            )
             
         except Exception as e:
             show_error_message(e, "Retriever Creation")
@@ -189,7 +962,11 @@ class VectorStoreManager:
     
     def save_vector_store(self, path: str) -> bool:
         """
-        Save vector store to disk
+        Save vector store to disk atomically
+        
+        The files are written and fsynced in a sibling ".tmp" directory that is renamed into place,
+        so a crash mid-write never leaves a half-written store at path. A crash during the swap
+        leaves the previous store at ".old", which the next save or load moves back.
         
         Args:
             path (str): Path to save vector store
@@ -203,7 +980,44 @@ class VectorStoreManager:
                 return False
             
             with st.spinner("Saving vector store..."):
-                self.vector_store.save_local(path)
+                path = os.path.normpath(path)
+                tmp_path = path + ".tmp"
+                old_path = path + ".old"
+                parent = os.path.dirname(os.path.abspath(path))
+                
+                # Only delete leftovers once path holds a complete store again
+                _recover_interrupted_save(path)
+                
+                # GPU indexes cannot be serialized; write a CPU copy instead
+                index = self.vector_store.index
+                if self._on_gpu:
+                    index = faiss.index_gpu_to_cpu(index)
+                
+                # Same layout as FAISS.save_local; a memory-mapped docstore is written as its own
+                # files and pickled as None
+                shutil.rmtree(tmp_path, ignore_errors=True)
+                os.makedirs(tmp_path)
+                faiss.write_index(index, os.path.join(tmp_path, "index.faiss"))
+                docstore = self.vector_store.docstore
+                if isinstance(docstore, MMapDocstore):
+                    docstore.save(tmp_path)
+                    docstore = None
+                with open(os.path.join(tmp_path, "index.pkl"), "wb") as f:
+                    pickle.dump((docstore, self.vector_store.index_to_docstore_id), f)
+                
+                # The renames below are only durable if the data they point at already is
+                for name in os.listdir(tmp_path):
+                    _fsync(os.path.join(tmp_path, name))
+                _fsync(tmp_path)
+                
+                # os.replace cannot overwrite a non-empty directory, so move the previous store aside
+                # first; readers that already mapped its files keep them until they close
+                shutil.rmtree(old_path, ignore_errors=True)
+                if os.path.exists(path):
+                    os.replace(path, old_path)
+                os.replace(tmp_path, path)
+                _fsync(parent)
+                shutil.rmtree(old_path, ignore_errors=True)
             
             show_success_message(f"Vector store saved to {path}")
             return True
@@ -212,23 +1026,47 @@ class VectorStoreManager:
             show_error_message(e, "Save Vector Store")
             return False
     
-    def load_vector_store(self, path: str) -> bool:
+    def load_vector_store(self, path: str, readonly: bool = False) -> bool:
         """
         Load vector store from disk
         
         Args:
             path (str): Path to load vector store from
+            readonly (bool): Memory-map the index and docstore read-only so IVF lists are paged in on demand and
+                processes loading the same path share one page-cache copy; the store is then
+                immutable and add_documents is disabled. Off by default so loaded stores can
+                still grow
             
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            if not self.embeddings:
-                if not self._initialize_embeddings():
-                    return False
-            
             with st.spinner("Loading vector store..."):
-                self.vector_store = FAISS.load_local(path, self.embeddings, allow_dangerous_deserialization=True)
+                path = os.path.normpath(path)
+                _recover_interrupted_save(path)
+                
+                # Read the files save_local writes ourselves, so the index can be memory-mapped
+                io_flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if readonly else 0
+                index = faiss.read_index(os.path.join(path, "index.faiss"), io_flags)
+                
+                with open(os.path.join(path, "index.pkl"), "rb") as f:
+                    docstore, index_to_docstore_id = pickle.load(f)
+                if docstore is None:
+                    docstore = MMapDocstore(path, readonly=readonly)
+                
+                self._close_docstore()
+                self.vector_store = self._wrap_index(index, docstore, index_to_docstore_id)
+            self._move_index_to_gpu()
+            
+            if readonly and faiss.try_extract_index_ivf(index) is None:
+                st.warning(
+                    f"Loaded a memory-mapped {type(index).__name__}; only IVF indexes are searched "
+                    "efficiently from a memory map"
+                )
+            
+            self.store_id = uuid.uuid4().hex
+            self.search_cache.clear()
+            self.read_only = readonly
             
             show_success_message(f"Vector store loaded from {path}")
             return True
@@ -252,7 +1090,11 @@ class VectorStoreManager:
             info = {
                 "status": "Active",
                 "embedding_model": config.embedding.model_name,
-                "search_type": "Similarity Search"
+                "search_type": "Similarity Search",
+                "distance_strategy": str(self.vector_store.distance_strategy.value),
+                "index_type": type(self.vector_store.index).__name__,
+                "device": "GPU" if self._on_gpu else "CPU",
+                "read_only": self.read_only
             }
             
             # Try to get vector count (FAISS specific)